@@ -16,6 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
+from .coordinator import QBittorrentDataCoordinator
 from .helpers import setup_client
 
 PLATFORMS = [Platform.SENSOR]
@@ -25,9 +26,8 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up qBittorrent from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
     try:
-        hass.data[DOMAIN][entry.entry_id] = await hass.async_add_executor_job(
+        client = await hass.async_add_executor_job(
             setup_client,
             entry.data[CONF_URL],
             entry.data[CONF_USERNAME],
@@ -39,6 +39,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except RequestException as err:
         raise ConfigEntryNotReady("Failed to connect") from err
 
+    coordinator = QBittorrentDataCoordinator(hass, client)
+    await coordinator.async_config_entry_first_refresh()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -0,0 +1,53 @@
+"""The qBittorrent coordinator."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import Any
+
+from qbittorrent.client import Client, LoginRequired
+from requests.exceptions import RequestException
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class QBittorrentDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator for updating qBittorrent data."""
+
+    def __init__(self, hass: HomeAssistant, client: Client) -> None:
+        """Initialize coordinator."""
+        self.client = client
+        self._rid = 0
+        self._server_state: dict[str, Any] = {}
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=30),
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the latest server state from qBittorrent."""
+        try:
+            data = await self.hass.async_add_executor_job(
+                self.client.sync_main_data, self._rid
+            )
+        except LoginRequired as err:
+            raise ConfigEntryError("Invalid authentication") from err
+        except RequestException as err:
+            raise UpdateFailed("Connection lost") from err
+
+        # Only the fields changed since the last response id are returned,
+        # so merge them into the state seen so far.
+        self._rid = data["rid"]
+        if data.get("full_update"):
+            self._server_state = {}
+        self._server_state.update(data.get("server_state", {}))
+        return self._server_state
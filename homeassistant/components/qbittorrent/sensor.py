@@ -1,10 +1,10 @@
 """Support for monitoring the qBittorrent API."""
 from __future__ import annotations
 
-import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
-from qbittorrent.client import Client, LoginRequired
-from requests.exceptions import RequestException
 import voluptuous as vol
 
 from homeassistant.components.sensor import (
@@ -26,35 +26,69 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEFAULT_NAME, DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
+from .coordinator import QBittorrentDataCoordinator
 
 SENSOR_TYPE_CURRENT_STATUS = "current_status"
 SENSOR_TYPE_DOWNLOAD_SPEED = "download_speed"
 SENSOR_TYPE_UPLOAD_SPEED = "upload_speed"
 
-SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+# Transfer status keyed by (uploading, downloading)
+TRANSFER_STATES: dict[tuple[bool, bool], str] = {
+    (True, True): "up_down",
+    (True, False): "seeding",
+    (False, True): "downloading",
+    (False, False): STATE_IDLE,
+}
+
+
+def _get_qbittorrent_state(data: dict[str, Any]) -> str:
+    """Return the current transfer status of qBittorrent."""
+    return TRANSFER_STATES[(data["up_info_speed"] > 0, data["dl_info_speed"] > 0)]
+
+
+@dataclass
+class QBittorrentMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[dict[str, Any]], StateType]
+
+
+@dataclass
+class QBittorrentSensorEntityDescription(SensorEntityDescription, QBittorrentMixin):
+    """Describes qBittorrent sensor entity."""
+
+
+SENSOR_TYPES: tuple[QBittorrentSensorEntityDescription, ...] = (
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_CURRENT_STATUS,
         name="Status",
+        value_fn=_get_qbittorrent_state,
     ),
-    SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_DOWNLOAD_SPEED,
         name="Down Speed",
         icon="mdi:cloud-download",
         device_class=SensorDeviceClass.DATA_RATE,
-        native_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_display_precision=2,
+        suggested_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["dl_info_speed"],
     ),
-    SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_UPLOAD_SPEED,
         name="Up Speed",
         icon="mdi:cloud-upload",
         device_class=SensorDeviceClass.DATA_RATE,
-        native_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_display_precision=2,
+        suggested_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data["up_info_speed"],
     ),
 )
 
@@ -74,68 +108,33 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up qBittorrent sensor entries."""
-    client: Client = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: QBittorrentDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     entities = [
-        QBittorrentSensor(description, client, config_entry)
+        QBittorrentSensor(description, coordinator, config_entry)
         for description in SENSOR_TYPES
     ]
-    async_add_entites(entities, True)
-
+    async_add_entites(entities)
 
-def format_speed(speed):
-    """Return a bytes/s measurement as a human readable string."""
-    kb_spd = float(speed) / 1024
-    return round(kb_spd, 2 if kb_spd < 0.1 else 1)
 
-
-class QBittorrentSensor(SensorEntity):
+class QBittorrentSensor(CoordinatorEntity[QBittorrentDataCoordinator], SensorEntity):
     """Representation of an qBittorrent sensor."""
 
+    entity_description: QBittorrentSensorEntityDescription
+
     def __init__(
         self,
-        description: SensorEntityDescription,
-        qbittorrent_client: Client,
+        description: QBittorrentSensorEntityDescription,
+        coordinator: QBittorrentDataCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the qBittorrent sensor."""
+        super().__init__(coordinator)
         self.entity_description = description
-        self.client = qbittorrent_client
 
         self._attr_unique_id = f"{config_entry.entry_id}-{description.key}"
         self._attr_name = f"{config_entry.title} {description.name}"
-        self._attr_available = False
-
-    def update(self) -> None:
-        """Get the latest data from qBittorrent and updates the state."""
-        try:
-            data = self.client.sync_main_data()
-            self._attr_available = True
-        except RequestException:
-            _LOGGER.error("Connection lost")
-            self._attr_available = False
-            return
-        except LoginRequired:
-            _LOGGER.error("Invalid authentication")
-            return
-
-        if data is None:
-            return
-
-        download = data["server_state"]["dl_info_speed"]
-        upload = data["server_state"]["up_info_speed"]
-
-        sensor_type = self.entity_description.key
-        if sensor_type == SENSOR_TYPE_CURRENT_STATUS:
-            if upload > 0 and download > 0:
-                self._attr_native_value = "up_down"
-            elif upload > 0 and download == 0:
-                self._attr_native_value = "seeding"
-            elif upload == 0 and download > 0:
-                self._attr_native_value = "downloading"
-            else:
-                self._attr_native_value = STATE_IDLE
-
-        elif sensor_type == SENSOR_TYPE_DOWNLOAD_SPEED:
-            self._attr_native_value = format_speed(download)
-        elif sensor_type == SENSOR_TYPE_UPLOAD_SPEED:
-            self._attr_native_value = format_speed(upload)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.data)